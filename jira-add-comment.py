@@ -9,11 +9,7 @@ import argparse
 import os
 import sys
 
-try:
-    from jira import JIRA
-except ImportError:
-    print("Required dependencies not installed. Run: pip install jira")
-    sys.exit(1)
+from jira_common import make_jira
 
 
 def add_comment_to_issue(server: str, token: str, issue_key: str, comment: str):
@@ -28,7 +24,7 @@ def add_comment_to_issue(server: str, token: str, issue_key: str, comment: str):
     """
     try:
         # Initialize JIRA connection
-        jira = JIRA(server=server, token_auth=token)
+        jira = make_jira(server, token)
 
         # Get the issue (to validate it exists)
         issue = jira.issue(issue_key)
@@ -9,11 +9,7 @@ import argparse
 import os
 import sys
 
-try:
-    from jira import JIRA
-except ImportError:
-    print("Required dependencies not installed. Run: pip install jira")
-    sys.exit(1)
+from jira_common import make_jira
 
 
 def add_label_to_issue(server: str, token: str, issue_key: str, label: str):
@@ -28,24 +24,20 @@ def add_label_to_issue(server: str, token: str, issue_key: str, label: str):
     """
     try:
         # Initialize JIRA connection
-        jira = JIRA(server=server, token_auth=token)
+        jira = make_jira(server, token)
 
-        # Get the issue
-        issue = jira.issue(issue_key)
-
-        # Get current labels
-        current_labels = issue.fields.labels or []
+        # Get only the issue's labels
+        issue = jira.issue(issue_key, fields='labels')
 
         # Check if label already exists
-        if label in current_labels:
+        if label in (issue.fields.labels or []):
             print(f"Label '{label}' already exists on issue {issue_key}")
             return
 
-        # Add the new label
-        new_labels = current_labels + [label]
-
-        # Update the issue
-        issue.update(fields={'labels': new_labels})
+        # Send only the delta with the atomic "add" operation, so concurrent
+        # label changes aren't overwritten. Issue.update() would reload the whole
+        # issue afterwards, so PUT the edit directly.
+        jira._session.put(jira._get_url(f'issue/{issue_key}'), json={'update': {'labels': [{'add': label}]}})
 
         print(f"Successfully added label '{label}' to issue {issue_key}")
 
@@ -7,10 +7,16 @@ excluding updates to specified fields from consideration.
 """
 
 import argparse
+import functools
+import hashlib
 import os
+import re
+import sqlite3
 import sys
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from typing import List, Dict, Any, FrozenSet, Optional
 import json
 
 # Global debug flag
@@ -21,61 +27,223 @@ def debug_print(message: str):
     if DEBUG:
         print(f"DEBUG: {message}", file=sys.stderr)
 
+def _set_debug(enabled: bool):
+    """Set the global debug flag (used to initialise worker processes)."""
+    global DEBUG
+    DEBUG = enabled
+
 try:
-    from jira import JIRA
-    import requests
+    from jira_common import cache_dir, make_jira
     from dateutil import parser as date_parser
     from dateutil.relativedelta import relativedelta
-    import re
 except ImportError:
     print("Required dependencies not installed. Run: pip install jira requests python-dateutil")
     sys.exit(1)
 
+# Optional: orjson serializes large JSON output much faster and handles datetimes natively
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only these fields are read from each issue; asking for fewer keeps responses small
+SEARCH_FIELDS = ['summary', 'status', 'assignee', 'created', 'updated']
+
+# Issues requested per search page; the server may cap this lower
+SEARCH_PAGE_SIZE = 1000
+
+# Concurrent search page requests once the total result count is known
+SEARCH_WORKERS = 8
+
+# Relative dates such as "4 weeks ago", "2 years ago", "a week ago" or "an hour ago"
+_RELATIVE_DATE_PATTERN = re.compile(
+    r'^(?:(\d+)\s+(second|minute|hour|day|week|month|year)s?'
+    r'|an?\s+(second|minute|hour|day|week|month|year))\s+ago$'
+)
+
+# Quoted JQL strings, whose contents must not be mistaken for keywords
+_JQL_QUOTED_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'')
+_JQL_ORDER_BY_PATTERN = re.compile(r'(?:^|\s)order\s+by\s', re.IGNORECASE)
+
+
+class IssueCache:
+    """
+    On-disk cache of each issue's last meaningful update.
+
+    An issue's changelog only changes when its "updated" date moves, so entries
+    are reused while that date matches and the same exclusions are in effect.
+    """
+
+    # Bump when the meaningful-update calculation changes to invalidate old entries
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS issues ('
+            'server TEXT, key TEXT, exclusions_hash TEXT, updated TEXT, last_meaningful_update TEXT, '
+            'PRIMARY KEY (server, key, exclusions_hash))'
+        )
+
+    @classmethod
+    def exclusions_hash(cls, exclude_fields: FrozenSet[str], exclude_users: FrozenSet[str]) -> str:
+        """Return a stable hash identifying a set of exclusions."""
+        data = json.dumps([cls.VERSION, sorted(exclude_fields), sorted(exclude_users)])
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def lookup(self, server: str, exclusions_hash: str, updated_by_key: Dict[str, str]) -> Dict[str, str]:
+        """
+        Find cached last meaningful updates for issues that haven't changed.
+
+        Args:
+            server: JIRA server URL
+            exclusions_hash: Hash from exclusions_hash()
+            updated_by_key: Mapping of issue key to its current "updated" timestamp
+
+        Returns:
+            Mapping of issue key to cached ISO last meaningful update, for cache hits only
+        """
+        keys = list(updated_by_key)
+        hits = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT key, updated, last_meaningful_update FROM issues "
+                f"WHERE server = ? AND exclusions_hash = ? AND key IN ({', '.join('?' * len(batch))})",
+                [server, exclusions_hash, *batch],
+            )
+            for key, updated, last_meaningful_update in rows:
+                if updated_by_key[key] == updated:
+                    hits[key] = last_meaningful_update
+        return hits
+
+    def store(self, server: str, exclusions_hash: str, entries: List[tuple]):
+        """Store (key, updated, ISO last meaningful update) entries."""
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO issues (server, key, exclusions_hash, updated, last_meaningful_update) VALUES (?, ?, ?, ?, ?)',
+                [(server, key, exclusions_hash, updated, last_meaningful_update) for key, updated, last_meaningful_update in entries],
+            )
+
 
 class JiraStaleChecker:
-    def __init__(self, server: str, token: str):
+    def __init__(self, server: str, token: str, use_cache: bool = True):
         """Initialize JIRA connection using personal access token."""
-        self.jira = JIRA(server=server, token_auth=token)
+        # One pooled connection per search worker so pages reuse TLS sessions
+        self.jira = make_jira(server, token, pool_size=SEARCH_WORKERS)
 
-    def get_issues_with_history(self, jql: str, exclude_fields: List[str], exclude_users: List[str] = None) -> List[Dict[str, Any]]:
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = IssueCache(os.path.join(cache_dir(), 'issues.sqlite'))
+            except (OSError, sqlite3.Error) as e:
+                debug_print(f"Issue cache unavailable, continuing without it: {e}")
+
+    def get_issues_with_history(self, jql: str, exclude_fields: List[str], exclude_users: List[str] = None,
+                                since_date: datetime = None, before_date: datetime = None,
+                                workers: int = 1) -> List[Dict[str, Any]]:
         """
         Get issues matching JQL and calculate their last meaningful update date.
 
+        Issues whose last meaningful update falls outside the optional date range
+        are dropped as they are processed, before sorting. Without any field or
+        user exclusions every update counts, so the issue's own "updated" date is
+        used and changelogs aren't fetched at all.
+
         Args:
             jql: JQL query string
-            exclude_fields: List of field names to exclude from update consideration
+            exclude_fields: List of field names or IDs to exclude from update consideration
             exclude_users: List of usernames to exclude from update consideration
+            since_date: Only include issues updated on or after this date (optional)
+            before_date: Only include issues updated on or before this date (optional)
+            workers: Number of processes used to analyse changelogs (1 analyses in-process)
 
         Returns:
-            List of dictionaries with issue data and calculated last update date
+            List of dictionaries with issue data and calculated last update datetime
         """
         debug_print(f"Executing JQL query: {jql}")
 
-        # Use field names directly - changelog entries use field names, not IDs
-        exclude_users = exclude_users or []
-
-        # Get issues from JQL query
-        debug_print("Fetching issues from JIRA...")
-        issues = self.jira.search_issues(jql, expand='changelog', maxResults=False)
+        # Changelog items carry both the field name and its ID ("fieldId"), so an
+        # exclusion given as either matches directly without resolving field
+        # metadata. Frozensets make the per-changelog-item membership checks O(1).
+        exclude_fields = frozenset(exclude_fields)
+        exclude_users = frozenset(exclude_users or [])
+
+        # Changelogs are only needed to skip over excluded updates
+        needs_changelog = bool(exclude_fields or exclude_users)
+
+        # Get issues from JQL query. With the cache enabled the first search skips
+        # changelogs; only issues that changed since the last run fetch them.
+        if not needs_changelog:
+            debug_print("Fetching issues from JIRA (no exclusions, skipping changelogs)...")
+            issues = self._search_issues(jql)
+            last_updates = {issue['key']: _parse_jira_timestamp(issue['fields']['updated']) for issue in issues}
+        elif self.cache is None:
+            debug_print("Fetching issues from JIRA...")
+            issues = self._search_issues(jql, expand=['changelog'])
+            last_updates = self._analyse_changelogs(issues, exclude_fields, exclude_users, workers)
+        else:
+            debug_print("Fetching issues from JIRA (changelogs only for uncached issues)...")
+            issues = self._search_issues(jql)
+            exclusions_hash = IssueCache.exclusions_hash(exclude_fields, exclude_users)
+            try:
+                cached = self.cache.lookup(self.jira.server_url, exclusions_hash,
+                                           {issue['key']: issue['fields']['updated'] for issue in issues})
+            except sqlite3.Error as e:
+                # Locked by a concurrent run or otherwise unreadable; recompute everything
+                debug_print(f"Issue cache lookup failed, continuing without it: {e}")
+                cached = {}
+            last_updates = {key: _parse_jira_timestamp(value) for key, value in cached.items()}
+            debug_print(f"Reusing cached last meaningful update for {len(cached)}/{len(issues)} issues")
+
+            changed = self._search_issues_by_key([issue['key'] for issue in issues if issue['key'] not in cached],
+                                                 fields=['created', 'updated'], expand=['changelog'])
+            computed = self._analyse_changelogs(changed, exclude_fields, exclude_users, workers)
+            last_updates.update(computed)
+            try:
+                self.cache.store(self.jira.server_url, exclusions_hash,
+                                 [(issue['key'], issue['fields']['updated'], computed[issue['key']].isoformat())
+                                  for issue in changed])
+            except sqlite3.Error as e:
+                debug_print(f"Issue cache update failed, continuing without it: {e}")
         debug_print(f"Found {len(issues)} issues matching JQL query")
 
         results = []
 
         for i, issue in enumerate(issues, 1):
-            debug_print(f"Processing issue {i}/{len(issues)}: {issue.key}")
-            last_meaningful_update = self._get_last_meaningful_update(issue, exclude_fields, exclude_users)
-
+            key = issue['key']
+            fields = issue['fields']
+            if DEBUG:
+                debug_print(f"Processing issue {i}/{len(issues)}: {key}")
+            last_meaningful_update = last_updates.get(key)
+            if last_meaningful_update is None:
+                # Issue vanished between the two searches (deleted or moved)
+                continue
+
+            if not _in_date_range(key, last_meaningful_update, since_date, before_date):
+                continue
+
+            assignee = fields.get('assignee')
             results.append({
-                'key': issue.key,
-                'summary': issue.fields.summary,
-                'status': issue.fields.status.name,
-                'assignee': issue.fields.assignee.displayName if issue.fields.assignee else 'Unassigned',
-                'created': issue.fields.created,
-                'updated': issue.fields.updated,
+                'key': key,
+                'summary': fields['summary'],
+                'status': fields['status']['name'],
+                'assignee': assignee['displayName'] if assignee else 'Unassigned',
+                'created': fields['created'],
+                'updated': fields['updated'],
                 'last_meaningful_update': last_meaningful_update,
-                'url': f"{self.jira.server_url}/browse/{issue.key}"
+                'url': f"{self.jira.server_url}/browse/{key}"
             })
 
+        if since_date or before_date:
+            filter_description = []
+            if since_date:
+                filter_description.append(f"--since {since_date.isoformat()}")
+            if before_date:
+                filter_description.append(f"--before {before_date.isoformat()}")
+            debug_print(f"Filtered {len(issues)} issues down to {len(results)} based on {' and '.join(filter_description)} filter(s)")
+
         # Sort by last meaningful update date (most recent first)
         debug_print("Sorting issues by last meaningful update date...")
         results.sort(key=lambda x: x['last_meaningful_update'], reverse=True)
@@ -83,70 +251,250 @@ class JiraStaleChecker:
 
         return results
 
-    def _get_last_meaningful_update(self, issue, exclude_fields: List[str], exclude_users: List[str] = None) -> str:
+    def _analyse_changelogs(self, issues: List[Dict[str, Any]], exclude_fields: FrozenSet[str], exclude_users: FrozenSet[str],
+                            workers: int = 1) -> Dict[str, datetime]:
         """
-        Find the most recent update to an issue, excluding specified fields and users.
+        Calculate the last meaningful update for each issue from its changelog.
 
         Args:
-            issue: JIRA issue object
-            exclude_fields: List of field names to exclude
-            exclude_users: List of usernames to exclude
+            issues: Raw issue dictionaries including their expanded changelog
+            exclude_fields: Set of field names or IDs to exclude
+            exclude_users: Set of usernames to exclude
+            workers: Number of processes to spread the work over (1 analyses in-process)
 
         Returns:
-            ISO date string of last meaningful update
+            Dictionary mapping issue key to its last meaningful update
         """
-        exclude_users = exclude_users or []
-
-        # Start with issue creation date as baseline
-        last_update = datetime.fromisoformat(issue.fields.created.replace('Z', '+00:00'))
-        debug_print(f"  Issue {issue.key} created: {last_update.isoformat()}")
-
-        meaningful_updates_count = 0
-        excluded_updates_count = 0
-        excluded_user_updates_count = 0
-
-        # Check changelog for meaningful updates
-        if hasattr(issue, 'changelog') and issue.changelog:
-            debug_print(f"  Analyzing {len(issue.changelog.histories)} changelog entries...")
-            for history in issue.changelog.histories:
-                # Get the author of this change
-                change_author = history.author.name if hasattr(history.author, 'name') else str(history.author)
-
-                # Skip if this user should be excluded
-                if change_author in exclude_users:
-                    debug_print(f"    {history.created}: Excluding change by user '{change_author}'")
-                    excluded_user_updates_count += 1
-                    continue
-
-                # Check if this history entry contains meaningful changes
-                has_meaningful_change = False
-                meaningful_fields = []
-                excluded_fields_in_history = []
-
-                for item in history.items:
-                    # Skip if this field should be excluded
-                    if item.field not in exclude_fields:
-                        has_meaningful_change = True
-                        meaningful_fields.append(item.field)
-                    else:
-                        excluded_fields_in_history.append(item.field)
-
-                if excluded_fields_in_history:
-                    debug_print(f"    {history.created}: Excluded fields changed: {excluded_fields_in_history} (by {change_author})")
-                    excluded_updates_count += 1
-
-                if has_meaningful_change:
-                    meaningful_updates_count += 1
-                    history_date = datetime.fromisoformat(history.created.replace('Z', '+00:00'))
-                    debug_print(f"    {history.created}: Meaningful change in fields: {meaningful_fields} (by {change_author})")
-                    if history_date > last_update:
-                        last_update = history_date
-                        debug_print(f"    → New last meaningful update: {last_update.isoformat()}")
-
-        debug_print(f"  Summary for {issue.key}: {meaningful_updates_count} meaningful updates, {excluded_updates_count} excluded field updates, {excluded_user_updates_count} excluded user updates")
-        debug_print(f"  Final last meaningful update: {last_update.isoformat()}")
-
-        return last_update.isoformat()
+        # Changelog analysis is independent per issue and CPU-bound, so large
+        # result sets can be spread over worker processes
+        if workers > 1 and len(issues) > 1:
+            debug_print(f"Analysing {len(issues)} changelogs with {workers} worker processes")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_set_debug, initargs=(DEBUG,)) as executor:
+                last_updates = list(executor.map(_get_last_meaningful_update, issues, repeat(exclude_fields), repeat(exclude_users),
+                                                 chunksize=max(1, len(issues) // (workers * 4))))
+        else:
+            last_updates = [_get_last_meaningful_update(issue, exclude_fields, exclude_users) for issue in issues]
+
+        return {issue['key']: last_update for issue, last_update in zip(issues, last_updates)}
+
+    def _search_issues_by_key(self, keys: List[str], fields: List[str] = None, expand: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch the given issues by key, in batches of SEARCH_PAGE_SIZE keys.
+
+        Keys that no longer exist are reported as warnings by the server rather
+        than failing the whole query.
+
+        Args:
+            keys: Issue keys to fetch
+            fields: Field names to include in each issue (defaults to SEARCH_FIELDS)
+            expand: Optional list of expansions (e.g. ['changelog'])
+
+        Returns:
+            List of raw issue dictionaries as returned by the REST API
+        """
+        issues = []
+        for start in range(0, len(keys), SEARCH_PAGE_SIZE):
+            batch = keys[start:start + SEARCH_PAGE_SIZE]
+            debug_print(f"Fetching changelogs for {len(batch)} issues...")
+            issues.extend(self._search_issues(f"key in ({', '.join(batch)})", fields, expand, validate_query=False))
+        return issues
+
+    def _search_issues(self, jql: str, fields: List[str] = None, expand: List[str] = None,
+                       validate_query: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch every issue matching JQL, paging through the search endpoint directly.
+
+        jira-python pages at 50 issues and requests all fields, so large result
+        sets cost many round-trips; here we ask for big pages and only the
+        fields we actually read. Issues are returned as the raw JSON dicts to
+        avoid wrapping each one (and its changelog) in Resource objects.
+
+        Args:
+            jql: JQL query string
+            fields: Field names to include in each issue (defaults to SEARCH_FIELDS)
+            expand: Optional list of expansions (e.g. ['changelog'])
+            validate_query: Optional validateQuery flag; False keeps keys that no longer
+                exist from failing the whole search
+
+        Returns:
+            List of raw issue dictionaries as returned by the REST API
+        """
+        url = self.jira._get_url('search')
+        payload = {
+            'jql': jql,
+            'fields': fields or SEARCH_FIELDS,
+            'expand': expand or [],
+            'maxResults': SEARCH_PAGE_SIZE,
+        }
+        if validate_query is not None:
+            payload['validateQuery'] = validate_query
+
+        # The first page tells us the total and the page size the server honours
+        first_page = self._fetch_search_page(url, payload, 0)
+        total = first_page.get('total', 0)
+        raw_issues = first_page.get('issues', [])
+        page_size = first_page.get('maxResults') or len(raw_issues)
+        debug_print(f"  Fetched {len(raw_issues)}/{total} issues in first page")
+
+        # Remaining pages are independent, so fetch them concurrently
+        if raw_issues and len(raw_issues) < total:
+            offsets = range(len(raw_issues), total, page_size)
+            debug_print(f"  Fetching {len(offsets)} more pages with {SEARCH_WORKERS} workers")
+            with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+                pages = executor.map(lambda start_at: self._fetch_search_page(url, payload, start_at), offsets)
+                for start_at, page in zip(offsets, pages):
+                    page_issues = page.get('issues', [])
+                    raw_issues.extend(page_issues)
+
+                    # The server may return a short page; fill the gap before moving on
+                    expected = min(page_size, total - start_at)
+                    while page_issues and len(page_issues) < expected:
+                        gap_start = start_at + len(page_issues)
+                        debug_print(f"  Short page at {start_at}, fetching from {gap_start}")
+                        extra = self._fetch_search_page(url, payload, gap_start).get('issues', [])[:expected - len(page_issues)]
+                        if not extra:
+                            break
+                        raw_issues.extend(extra)
+                        page_issues = page_issues + extra
+
+        debug_print(f"  Fetched {len(raw_issues)}/{total} issues")
+        return raw_issues
+
+    def _fetch_search_page(self, url: str, payload: Dict[str, Any], start_at: int) -> Dict[str, Any]:
+        """Fetch a single page of search results starting at the given offset."""
+        return self.jira._session.post(url, json=dict(payload, startAt=start_at)).json()
+
+
+def _get_last_meaningful_update(issue: Dict[str, Any], exclude_fields: FrozenSet[str], exclude_users: FrozenSet[str] = frozenset()) -> datetime:
+    """
+    Find the most recent update to an issue, excluding specified fields and users.
+
+    Changelog histories come back oldest first, so the scan starts from the
+    newest entry and stops at the first meaningful one. With --debug the whole
+    changelog is walked instead, to report every entry.
+
+    A module-level function taking only picklable arguments, so it can run in
+    worker processes.
+
+    Args:
+        issue: Raw issue dictionary from the search API
+        exclude_fields: Set of field names or IDs to exclude
+        exclude_users: Set of usernames to exclude
+
+    Returns:
+        Timezone-aware datetime of last meaningful update
+    """
+    if DEBUG:
+        return _debug_last_meaningful_update(issue, exclude_fields, exclude_users)
+
+    # Start with issue creation date as baseline; compare raw timestamps and parse once at the end
+    last_update = issue['fields']['created']
+
+    for history in reversed((issue.get('changelog') or {}).get('histories', [])):
+        # Get the author of this change (Cloud users may only have a display name)
+        author = history.get('author') or {}
+        if (author.get('name') or author.get('displayName', '')) in exclude_users:
+            continue
+
+        if any(item['field'] not in exclude_fields and item.get('fieldId') not in exclude_fields
+               for item in history['items']):
+            last_update = _later_timestamp(last_update, history['created'])
+            break
+
+    return _parse_jira_timestamp(last_update)
+
+
+def _debug_last_meaningful_update(issue: Dict[str, Any], exclude_fields: FrozenSet[str], exclude_users: FrozenSet[str]) -> datetime:
+    """
+    Full changelog scan behind _get_last_meaningful_update() that reports each entry.
+
+    Args:
+        issue: Raw issue dictionary from the search API
+        exclude_fields: Set of field names or IDs to exclude
+        exclude_users: Set of usernames to exclude
+
+    Returns:
+        Timezone-aware datetime of last meaningful update
+    """
+    # Start with issue creation date as baseline
+    last_update = issue['fields']['created']
+    debug_print(f"  Issue {issue['key']} created: {last_update}")
+
+    meaningful_updates_count = 0
+    excluded_updates_count = 0
+    excluded_user_updates_count = 0
+
+    # Check changelog for meaningful updates
+    histories = (issue.get('changelog') or {}).get('histories', [])
+    if histories:
+        debug_print(f"  Analyzing {len(histories)} changelog entries...")
+        for history in histories:
+            # Get the author of this change (Cloud users may only have a display name)
+            author = history.get('author') or {}
+            change_author = author.get('name') or author.get('displayName', '')
+            created = history['created']
+
+            # Skip if this user should be excluded
+            if change_author in exclude_users:
+                debug_print(f"    {created}: Excluding change by user '{change_author}'")
+                excluded_user_updates_count += 1
+                continue
+
+            # Check if this history entry contains meaningful changes
+            meaningful_fields = []
+            excluded_fields_in_history = []
+            for item in history['items']:
+                if item['field'] in exclude_fields or item.get('fieldId') in exclude_fields:
+                    excluded_fields_in_history.append(item['field'])
+                else:
+                    meaningful_fields.append(item['field'])
+
+            if excluded_fields_in_history:
+                debug_print(f"    {created}: Excluded fields changed: {excluded_fields_in_history} (by {change_author})")
+                excluded_updates_count += 1
+
+            if meaningful_fields:
+                meaningful_updates_count += 1
+                debug_print(f"    {created}: Meaningful change in fields: {meaningful_fields} (by {change_author})")
+                if _later_timestamp(last_update, created) != last_update:
+                    last_update = created
+                    debug_print(f"    → New last meaningful update: {last_update}")
+
+    last_update = _parse_jira_timestamp(last_update)
+    debug_print(f"  Summary for {issue['key']}: {meaningful_updates_count} meaningful updates, {excluded_updates_count} excluded field updates, {excluded_user_updates_count} excluded user updates")
+    debug_print(f"  Final last meaningful update: {last_update.isoformat()}")
+
+    return last_update
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_jira_timestamp(value: str) -> datetime:
+    """
+    Parse a JIRA timestamp such as "2024-01-15T10:30:00.000+0000".
+
+    Cached because bulk-created or bulk-edited issues share identical timestamps.
+    """
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _utc_offset_suffix(value: str) -> str:
+    """Return the trailing UTC offset of a JIRA timestamp ("Z", "+0000", "-05:00", ...)."""
+    if value.endswith('Z'):
+        return 'Z'
+    return value[max(value.rfind('+'), value.rfind('-')):]
+
+
+def _later_timestamp(first: str, second: str) -> str:
+    """
+    Return the later of two JIRA timestamp strings.
+
+    JIRA timestamps are fixed-width, so two with the same length and UTC offset
+    order correctly as plain strings; only mixed offsets (e.g. across a DST
+    change) need to be parsed.
+    """
+    if len(first) == len(second) and _utc_offset_suffix(first) == _utc_offset_suffix(second):
+        return first if first >= second else second
+    return first if _parse_jira_timestamp(first) >= _parse_jira_timestamp(second) else second
 
 
 def parse_since_date(since_str: str) -> datetime:
@@ -170,7 +518,6 @@ def parse_since_date(since_str: str) -> datetime:
         parsed_date = datetime.fromisoformat(since_str)
         # If the parsed date is naive, make it timezone-aware (UTC)
         if parsed_date.tzinfo is None:
-            from datetime import timezone
             parsed_date = parsed_date.replace(tzinfo=timezone.utc)
         return parsed_date
     except ValueError:
@@ -178,105 +525,119 @@ def parse_since_date(since_str: str) -> datetime:
 
     # Try human-friendly relative dates
     # Use UTC timezone to match JIRA timestamps
-    from datetime import timezone
     now = datetime.now(timezone.utc)
     since_str_lower = since_str.lower().strip()
 
-    # Pattern matching for relative dates
-    patterns = [
-        # "4 weeks ago", "2 years ago", "1 month ago"
-        (r'^(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago$', 1),
-        # "a week ago", "an hour ago"
-        (r'^(a|an)\s+(second|minute|hour|day|week|month|year)\s+ago$', 1),
-    ]
-
-    for pattern, multiplier in patterns:
-        match = re.match(pattern, since_str_lower)
-        if match:
-            if match.group(1) in ['a', 'an']:
-                amount = 1
-                unit = match.group(2)
-            else:
-                amount = int(match.group(1))
-                unit = match.group(2)
-
-            # Convert to relativedelta arguments
-            if unit.startswith('second'):
-                delta = relativedelta(seconds=amount)
-            elif unit.startswith('minute'):
-                delta = relativedelta(minutes=amount)
-            elif unit.startswith('hour'):
-                delta = relativedelta(hours=amount)
-            elif unit.startswith('day'):
-                delta = relativedelta(days=amount)
-            elif unit.startswith('week'):
-                delta = relativedelta(weeks=amount)
-            elif unit.startswith('month'):
-                delta = relativedelta(months=amount)
-            elif unit.startswith('year'):
-                delta = relativedelta(years=amount)
-            else:
-                raise ValueError(f"Unknown time unit: {unit}")
-
-            return now - delta
+    match = _RELATIVE_DATE_PATTERN.match(since_str_lower)
+    if match:
+        amount = int(match.group(1)) if match.group(1) else 1
+        unit = match.group(2) or match.group(3)
+
+        # Convert to relativedelta arguments
+        if unit.startswith('second'):
+            delta = relativedelta(seconds=amount)
+        elif unit.startswith('minute'):
+            delta = relativedelta(minutes=amount)
+        elif unit.startswith('hour'):
+            delta = relativedelta(hours=amount)
+        elif unit.startswith('day'):
+            delta = relativedelta(days=amount)
+        elif unit.startswith('week'):
+            delta = relativedelta(weeks=amount)
+        elif unit.startswith('month'):
+            delta = relativedelta(months=amount)
+        elif unit.startswith('year'):
+            delta = relativedelta(years=amount)
+        else:
+            raise ValueError(f"Unknown time unit: {unit}")
+
+        return now - delta
 
     # Try dateutil's parser as fallback
     try:
         parsed_date = date_parser.parse(since_str)
         # If the parsed date is naive, make it timezone-aware (UTC)
         if parsed_date.tzinfo is None:
-            from datetime import timezone
             parsed_date = parsed_date.replace(tzinfo=timezone.utc)
         return parsed_date
     except Exception as e:
         raise ValueError(f"Could not parse date '{since_str}'. Use formats like 'YYYY-MM-DD', '4 weeks ago', or '2 years ago'. Error: {e}")
 
 
-def filter_issues_by_date_range(issues: List[Dict[str, Any]], since_date: datetime = None, before_date: datetime = None) -> List[Dict[str, Any]]:
+def _augment_jql(jql: str, since_date: datetime = None, before_date: datetime = None) -> str:
     """
-    Filter issues to only include those updated within the given date range.
+    Narrow a JQL query with date bounds the server can evaluate cheaply.
+
+    The last meaningful update always falls between an issue's created and
+    updated dates, so the server can drop issues updated before --since or
+    created after --before. JQL dates mean midnight in the JIRA user's
+    timezone, which can be up to 14 hours either side of UTC, so the lower
+    bound is moved back a day and the upper bound, which must also cover the
+    time of day in --before, forward two; the exact comparison still happens
+    client-side.
 
     Args:
-        issues: List of issue dictionaries
-        since_date: Only include issues updated on or after this date (optional)
-        before_date: Only include issues updated on or before this date (optional)
+        jql: JQL query string, optionally ending in an ORDER BY clause
+        since_date: Lower bound from --since (optional)
+        before_date: Upper bound from --before (optional)
 
     Returns:
-        Filtered list of issues
+        JQL query string with the extra date clauses applied
     """
-    if not since_date and not before_date:
-        return issues
+    clauses = []
+    if since_date:
+        clauses.append(f'updated >= "{(since_date - timedelta(days=1)).strftime("%Y-%m-%d")}"')
+    if before_date:
+        clauses.append(f'created < "{(before_date + timedelta(days=2)).strftime("%Y-%m-%d")}"')
 
-    filtered_issues = []
+    if not clauses:
+        return jql
 
-    for issue in issues:
-        issue_last_update = datetime.fromisoformat(issue['last_meaningful_update'])
-        include_issue = True
-        exclusion_reason = None
-
-        # Check since date constraint
-        if since_date and issue_last_update < since_date:
-            include_issue = False
-            exclusion_reason = f"last update {issue_last_update.isoformat()} is before --since date {since_date.isoformat()}"
-
-        # Check before date constraint
-        if before_date and issue_last_update > before_date:
-            include_issue = False
-            exclusion_reason = f"last update {issue_last_update.isoformat()} is after --before date {before_date.isoformat()}"
-
-        if include_issue:
-            filtered_issues.append(issue)
-        else:
-            debug_print(f"  Excluding {issue['key']}: {exclusion_reason}")
+    # Keep any ORDER BY clause at the end of the augmented query. Quoted strings
+    # are blanked out first so an "order by" inside one is not split on; if a
+    # quote is left unbalanced the query is wrapped unchanged.
+    query, order_by = jql, ''
+    unquoted = _JQL_QUOTED_PATTERN.sub(lambda m: ' ' * len(m.group()), jql)
+    match = None
+    if '"' not in unquoted and "'" not in unquoted:
+        match = _JQL_ORDER_BY_PATTERN.search(unquoted)
+    if match:
+        query, order_by = jql[:match.start()], ' ' + jql[match.start():].strip()
 
-    filter_description = []
-    if since_date:
-        filter_description.append(f"--since {since_date.isoformat()}")
-    if before_date:
-        filter_description.append(f"--before {before_date.isoformat()}")
+    if query.strip():
+        clauses.insert(0, f"({query.strip()})")
+
+    augmented = ' AND '.join(clauses) + order_by
+    debug_print(f"Augmented JQL query: {augmented}")
+    return augmented
+
+
+def _in_date_range(issue_key: str, last_update: datetime, since_date: datetime = None, before_date: datetime = None) -> bool:
+    """
+    Check whether an issue's last meaningful update falls within the given date range.
+
+    Args:
+        issue_key: Issue key, used for debug output
+        last_update: The issue's last meaningful update
+        since_date: Only include issues updated on or after this date (optional)
+        before_date: Only include issues updated on or before this date (optional)
+
+    Returns:
+        True if the issue should be included
+    """
+    # Check since date constraint
+    if since_date and last_update < since_date:
+        if DEBUG:
+            debug_print(f"  Excluding {issue_key}: last update {last_update.isoformat()} is before --since date {since_date.isoformat()}")
+        return False
+
+    # Check before date constraint
+    if before_date and last_update > before_date:
+        if DEBUG:
+            debug_print(f"  Excluding {issue_key}: last update {last_update.isoformat()} is after --before date {before_date.isoformat()}")
+        return False
 
-    debug_print(f"Filtered {len(issues)} issues down to {len(filtered_issues)} based on {' and '.join(filter_description)} filter(s)")
-    return filtered_issues
+    return True
 
 
 def main():
@@ -287,13 +648,17 @@ def main():
     parser.add_argument('--token', help='JIRA personal access token',
                        default=os.environ.get('JIRA_TOKEN'))
     parser.add_argument('--exclude-field', action='append', dest='exclude_fields',
-                       help='Field name to exclude from update consideration (e.g., "Story Points", "Comment", "Sprint"). Can be used multiple times.')
+                       help='Field name or ID to exclude from update consideration (e.g., "Story Points", "Comment", "Sprint", "customfield_10001"). Can be used multiple times.')
     parser.add_argument('--format', choices=['json', 'table', 'csv'], default='table',
                        help='Output format')
     parser.add_argument('--since', help='Only include issues with meaningful updates since this date. Accepts YYYY-MM-DD format or human-friendly formats like "4 weeks ago", "2 years ago"')
     parser.add_argument('--before', help='Only include issues with meaningful updates before this date. Accepts YYYY-MM-DD format or human-friendly formats like "4 weeks ago", "2 years ago"')
     parser.add_argument('--exclude-user', action='append', dest='exclude_users',
                        help='Username to exclude from update consideration. Changes made by this user will be ignored when determining last meaningful update. Can be used multiple times.')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or update the on-disk cache of last meaningful updates')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of processes used to analyse issue changelogs (default: 1). Helps with very large result sets.')
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug output to stderr')
 
@@ -311,7 +676,7 @@ def main():
 
     try:
         debug_print("Initializing JIRA connection...")
-        checker = JiraStaleChecker(args.url, args.token)
+        checker = JiraStaleChecker(args.url, args.token, use_cache=not args.no_cache)
         debug_print("JIRA connection established")
 
 
@@ -320,9 +685,8 @@ def main():
         debug_print(f"Starting issue analysis with {len(exclude_fields)} excluded fields and {len(exclude_users)} excluded users")
         if exclude_users:
             debug_print(f"Excluded users: {exclude_users}")
-        issues = checker.get_issues_with_history(args.jql, exclude_fields, exclude_users)
 
-        # Apply --since and --before filters if provided
+        # Parse --since and --before up front so they can narrow the JQL query
         since_date = None
         before_date = None
 
@@ -342,14 +706,13 @@ def main():
                 print(f"Error parsing --before date: {e}")
                 sys.exit(1)
 
-        # Apply date range filtering
-        if since_date or before_date:
-            issues = filter_issues_by_date_range(issues, since_date, before_date)
+        jql = _augment_jql(args.jql, since_date, before_date)
+        issues = checker.get_issues_with_history(jql, exclude_fields, exclude_users, since_date, before_date, args.workers)
 
         # Output results
         debug_print(f"Outputting {len(issues)} issues in {args.format} format")
         if args.format == 'json':
-            print(json.dumps(issues, indent=2))
+            _output_json(issues)
         elif args.format == 'csv':
             _output_csv(issues)
         else:
@@ -360,6 +723,19 @@ def main():
         sys.exit(1)
 
 
+def _serialize_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of an issue dict with its datetime rendered as an ISO string."""
+    return dict(issue, last_meaningful_update=issue['last_meaningful_update'].isoformat())
+
+
+def _output_json(issues: List[Dict[str, Any]]):
+    """Output issues in JSON format, using orjson when it is installed."""
+    if orjson is not None:
+        sys.stdout.write(orjson.dumps(issues, option=orjson.OPT_INDENT_2).decode('utf-8') + '\n')
+    else:
+        print(json.dumps(issues, indent=2, default=datetime.isoformat))
+
+
 def _output_table(issues: List[Dict[str, Any]]):
     """Output issues in table format."""
     if not issues:
@@ -372,21 +748,19 @@ def _output_table(issues: List[Dict[str, Any]]):
 
     # Print issues
     for issue in issues:
-        last_update = datetime.fromisoformat(issue['last_meaningful_update']).strftime('%Y-%m-%d %H:%M:%S')
+        last_update = issue['last_meaningful_update'].strftime('%Y-%m-%d %H:%M:%S')
         summary = issue['summary'][:47] + "..." if len(issue['summary']) > 50 else issue['summary']
         print(f"{issue['key']:<12} {issue['status']:<15} {last_update:<25} {summary}")
 
 
 def _output_csv(issues: List[Dict[str, Any]]):
-    """Output issues in CSV format."""
+    """Output issues in CSV format, streaming rows straight to stdout."""
     import csv
-    import io
 
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=['key', 'summary', 'status', 'assignee', 'created', 'updated', 'last_meaningful_update', 'url'])
+    writer = csv.DictWriter(sys.stdout, fieldnames=['key', 'summary', 'status', 'assignee', 'created', 'updated', 'last_meaningful_update', 'url'],
+                            extrasaction='ignore')
     writer.writeheader()
-    writer.writerows(issues)
-    print(output.getvalue())
+    writer.writerows(_serialize_issue(issue) for issue in issues)
 
 
 
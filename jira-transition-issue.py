@@ -2,120 +2,571 @@
 """
 JIRA Transition Issue
 
-Simple script to transition a JIRA issue through a specified transition.
+Simple script to transition one or more JIRA issues through a specified transition.
 """
 
 import argparse
+import functools
+import importlib.util
+import json
 import os
 import sys
+import threading
+import time
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
-try:
-    from jira import JIRA
-except ImportError:
-    print("Required dependencies not installed. Run: pip install jira")
-    sys.exit(1)
+from jira_common import cache_dir, make_jira
 
+# A single transition makes at most three requests, one after another
+POOL_SIZE = 4
 
-def transition_issue(server: str, token: str, issue_key: str, transition_name: str, resolution: str = None):
+# Issues transitioned concurrently in batch mode unless --parallel says otherwise
+DEFAULT_PARALLEL = 8
+
+# How long a cached transition name -> id mapping is trusted, in seconds
+TRANSITION_CACHE_TTL = 600
+
+# Attempts, including the first, for a request that fails transiently
+RETRY_ATTEMPTS = 4
+
+# Gateway errors on which a transition POST is retried: JIRA itself never saw the
+# request. A 504 is not retried, as the transition may already have gone through.
+TRANSITION_RETRY_STATUSES = (502, 503)
+
+# Statuses retried in the httpx backend, which has no session-level retries
+_ASYNC_RETRY_STATUSES = {
+    'GET': (429, 500, 502, 503, 504),
+    'POST': (429,) + TRANSITION_RETRY_STATUSES,
+}
+
+# Transitions resolved or loaded from disk by this process, keyed like the disk cache
+_TRANSITION_ID_CACHE: Dict[str, Dict[str, Any]] = {}
+_TRANSITION_CACHE_LOCK = threading.Lock()
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff before retrying: 0.5s, 1s, 2s, ... capped at 10s."""
+    return min(10.0, 0.5 * 2 ** attempt)
+
+
+@functools.lru_cache(maxsize=4)
+def get_jira_client(server: str, token: str, pool_size: int = POOL_SIZE):
     """
-    Transition a JIRA issue through a specified transition.
+    Return a JIRA client for the server, reusing one already created in this process.
 
     Args:
         server: JIRA server URL
         token: JIRA personal access token
+        pool_size: Number of connections to keep open to the server
+
+    Returns:
+        Configured JIRA client
+    """
+    return make_jira(server, token, pool_size=pool_size)
+
+
+def _transition_cache_path() -> str:
+    return os.path.join(cache_dir(), 'transitions.json')
+
+
+def _transition_cache_key(server: str, issue_key: str, transition_name: str) -> str:
+    project_key = issue_key.rsplit('-', 1)[0]
+    return '|'.join([server.rstrip('/'), project_key, transition_name.casefold()])
+
+
+def _load_transition_cache() -> Dict[str, Any]:
+    try:
+        with open(_transition_cache_path()) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_transition_cache(cache: Dict[str, Any]):
+    now = time.time()
+    cache = {key: entry for key, entry in cache.items() if now - entry.get('cached_at', 0) < TRANSITION_CACHE_TTL}
+    try:
+        path = _transition_cache_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is only an optimisation; failing to persist it is harmless
+        pass
+
+
+def _cached_transition(server: str, issue_key: str, transition_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a previously resolved transition for the issue's project.
+
+    Args:
+        server: JIRA server URL
         issue_key: The issue key (e.g., "PROJ-123")
         transition_name: The name of the transition to execute
-        resolution: Optional resolution to set during transition
+
+    Returns:
+        Transition dict with 'id', 'name' and 'to', or None if not cached or expired
     """
-    try:
-        # Initialize JIRA connection
-        jira = JIRA(server=server, token_auth=token)
+    key = _transition_cache_key(server, issue_key, transition_name)
+    entry = _TRANSITION_ID_CACHE.get(key)
+    if entry is None:
+        entry = _load_transition_cache().get(key)
+        if entry:
+            _TRANSITION_ID_CACHE[key] = entry
+    if not entry or time.time() - entry.get('cached_at', 0) >= TRANSITION_CACHE_TTL:
+        return None
+    return entry
 
-        # Get the issue
-        issue = jira.issue(issue_key)
-        print(f"Current status of {issue_key}: {issue.fields.status.name}")
 
-        # Get available transitions
-        transitions = jira.transitions(issue)
+def _remember_transition(server: str, issue_key: str, transition_name: str, transition: Optional[Dict[str, Any]]):
+    """
+    Store (or, when transition is None, evict) the resolved transition for the issue's project.
+    """
+    key = _transition_cache_key(server, issue_key, transition_name)
+    # Batch workers share the cache file, so serialise the read-modify-write
+    with _TRANSITION_CACHE_LOCK:
+        cache = _load_transition_cache()
+        if transition is None:
+            _TRANSITION_ID_CACHE.pop(key, None)
+            cache.pop(key, None)
+        else:
+            cache[key] = _TRANSITION_ID_CACHE[key] = {
+                'id': transition['id'],
+                'name': transition['name'],
+                'to': {'name': transition.get('to', {}).get('name', transition_name)},
+                'cached_at': time.time(),
+            }
+        _save_transition_cache(cache)
 
-        # Find the requested transition
-        target_transition = None
-        for transition in transitions:
-            if transition['name'].lower() == transition_name.lower():
-                target_transition = transition
-                break
 
-        if not target_transition:
-            print(f"Error: Transition '{transition_name}' not available for issue {issue_key}")
-            print("Available transitions:")
-            for transition in transitions:
-                print(f"  - {transition['name']}")
-            sys.exit(1)
+@functools.lru_cache(maxsize=64)
+def _transition_index(names: Tuple[str, ...]) -> Dict[str, int]:
+    """
+    Map casefolded transition names to the position of the first transition with that name.
 
+    Issues in the same status share the same transitions, so in batch mode each
+    distinct list is only casefolded once.
+    """
+    index = {}
+    for position, name in enumerate(names):
+        index.setdefault(name.casefold(), position)
+    return index
+
+
+def _find_transition(transitions: List[Dict[str, Any]], transition_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Find a transition by name, ignoring case.
+
+    Args:
+        transitions: Transition dicts as returned by JIRA (id, name, to)
+        transition_name: The name of the transition to find
+
+    Returns:
+        The first transition with that name, or None if there is none
+    """
+    index = _transition_index(tuple(transition['name'] for transition in transitions))
+    position = index.get(transition_name.casefold())
+    return None if position is None else transitions[position]
+
+
+def _new_result(issue_key: str, transition_name: Optional[str], resolution: str = None) -> Dict[str, Any]:
+    """Start the outcome record for one issue's transition."""
+    return {
+        'issue': issue_key,
+        'transition': transition_name,
+        'from': None,
+        'to': None,
+        'resolution': resolution,
+        'success': False,
+        'error': None,
+        'available': None,
+    }
+
+
+def print_result(result: Dict[str, Any], output_format: str = 'text'):
+    """
+    Print the outcome of one issue's transition, or its available transitions.
+
+    Args:
+        result: Outcome record returned by transition_issue()
+        output_format: 'text' for human-readable lines, 'json' for one JSON object per line
+    """
+    if output_format == 'json':
+        sys.stdout.write(json.dumps(result) + '\n')
+        return
+
+    issue_key = result['issue']
+    lines = []
+    if result['transition'] is None:
+        # Only listing the available transitions
+        if result['error']:
+            lines.append(f"Error getting transitions for issue {issue_key}: {result['error']}")
+        else:
+            lines.append(f"Issue {issue_key} - Current status: {result['from']}")
+            if not result['available']:
+                lines.append("No transitions available for this issue.")
+            else:
+                lines.append("\nAvailable transitions:")
+                lines.extend(f"  - {name}" for name in result['available'])
+        sys.stdout.write('\n'.join(lines) + '\n')
+        return
+
+    if result['from']:
+        lines.append(f"Current status of {issue_key}: {result['from']}")
+    if result['success']:
+        success_msg = f"Successfully transitioned {issue_key} via '{result['transition']}' to: {result['to']}"
+        if result['resolution']:
+            success_msg += f" with resolution: {result['resolution']}"
+        lines.append(success_msg)
+    elif result['available'] is not None:
+        lines.append(f"Error: Transition '{result['transition']}' not available for issue {issue_key}")
+        lines.append("Available transitions:")
+        lines.extend(f"  - {name}" for name in result['available'])
+    else:
+        lines.append(f"Error transitioning issue {issue_key}: {result['error']}")
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _post_transition(jira, issue, transition_id: str, fields: Optional[Dict[str, Any]]):
+    """
+    POST a transition, retrying gateway errors that mean JIRA never received it.
+
+    The client's session already retries rate limiting and connection errors for
+    every request, and 5xx responses for GETs only.
+
+    Args:
+        jira: JIRA client
+        issue: Issue or issue key to transition
+        transition_id: Id of the transition to execute
+        fields: Fields to set during the transition, or None
+    """
+    from jira.exceptions import JIRAError
+
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return jira.transition_issue(issue, transition_id, fields=fields)
+        except JIRAError as e:
+            if e.status_code not in TRANSITION_RETRY_STATUSES or attempt == RETRY_ATTEMPTS - 1:
+                raise
+        time.sleep(_retry_delay(attempt))
+
+
+def transition_issue(server: str, token: str, issue_key: str, transition_name: Optional[str], resolution: str = None,
+                     verify: bool = False, cache_transitions: bool = False,
+                     pool_size: int = POOL_SIZE) -> Dict[str, Any]:
+    """
+    Transition a JIRA issue through a specified transition, or list its available transitions.
+
+    Args:
+        server: JIRA server URL
+        token: JIRA personal access token
+        issue_key: The issue key (e.g., "PROJ-123")
+        transition_name: The name of the transition to execute, or None to only
+            list the available transitions
+        resolution: Optional resolution to set during transition
+        verify: Re-fetch the issue afterwards to report its actual status
+        cache_transitions: Reuse the transition id resolved for the same project and
+            name within the last few minutes, skipping the issue lookup entirely
+        pool_size: Number of connections to keep open to the server
+
+    Returns:
+        Outcome record with the issue, transition, from/to status, resolution,
+        success flag, error message and (when the transition was not found) the
+        names of the available transitions; print it with print_result()
+    """
+    # Initialize JIRA connection
+    jira = get_jira_client(server, token, pool_size)
+    from jira.exceptions import JIRAError
+    from requests.exceptions import RequestException
+
+    result = _new_result(issue_key, transition_name, resolution)
+    try:
         # Prepare transition fields
         fields = {}
         if resolution:
             fields['resolution'] = {'name': resolution}
 
-        # Execute the transition
-        jira.transition_issue(issue, target_transition['id'], fields=fields if fields else None)
+        # Try a recently resolved transition id straight away
+        target_transition = None
+        if cache_transitions and transition_name is not None:
+            target_transition = _cached_transition(server, issue_key, transition_name)
+            if target_transition:
+                try:
+                    _post_transition(jira, issue_key, target_transition['id'], fields if fields else None)
+                except JIRAError as e:
+                    if e.status_code != 400:
+                        raise
+                    # Not valid from this issue's status or workflow; resolve it afresh
+                    _remember_transition(server, issue_key, transition_name, None)
+                    target_transition = None
 
-        # Get updated issue status
-        updated_issue = jira.issue(issue_key)
-        success_msg = f"Successfully transitioned {issue_key} via '{transition_name}' to: {updated_issue.fields.status.name}"
-        if resolution:
-            success_msg += f" with resolution: {resolution}"
-        print(success_msg)
+        if not target_transition:
+            # Get the issue's status along with its available transitions in one request
+            issue = jira.issue(issue_key, fields='status', expand='transitions')
+            result['from'] = issue.fields.status.name
+            transitions = issue.raw.get('transitions', [])
 
-    except Exception as e:
-        print(f"Error transitioning issue {issue_key}: {e}")
-        sys.exit(1)
+            if transition_name is None:
+                result['available'] = [transition['name'] for transition in transitions]
+                result['success'] = True
+                return result
+
+            # Find the requested transition
+            target_transition = _find_transition(transitions, transition_name)
+
+            if not target_transition:
+                result['available'] = [transition['name'] for transition in transitions]
+                return result
+
+            # Execute the transition
+            _post_transition(jira, issue, target_transition['id'], fields if fields else None)
+
+            if cache_transitions:
+                _remember_transition(server, issue_key, transition_name, target_transition)
 
+        # The transition metadata already names the destination status; only
+        # re-fetch the issue when the caller asks for the status to be verified
+        if verify:
+            result['to'] = jira.issue(issue_key, fields='status').fields.status.name
+        else:
+            result['to'] = target_transition.get('to', {}).get('name', transition_name)
+        result['success'] = True
 
-def list_transitions(server: str, token: str, issue_key: str):
+    except (JIRAError, RequestException) as e:
+        result['error'] = str(e)
+    return result
+
+
+def transition_many(server: str, token: str, issue_keys: List[str], transition_name: Optional[str],
+                    resolution: str = None,
+                    verify: bool = False, cache_transitions: bool = False,
+                    parallel: int = DEFAULT_PARALLEL) -> Iterator[Dict[str, Any]]:
     """
-    List all available transitions for an issue.
+    Transition several JIRA issues concurrently through the same transition.
+
+    All workers share one client whose connection pool matches the worker count.
 
     Args:
         server: JIRA server URL
         token: JIRA personal access token
+        issue_keys: The issue keys (e.g., ["PROJ-123", "PROJ-456"])
+        transition_name: The name of the transition to execute, or None to only
+            list the available transitions
+        resolution: Optional resolution to set during transition
+        verify: Re-fetch each issue afterwards to report its actual status
+        cache_transitions: Reuse transition ids resolved for the same project and name
+        parallel: Maximum number of issues to transition at once
+
+    Yields:
+        Outcome record for each issue, in the order of issue_keys, as soon as it
+        and every issue before it have been handled
+    """
+    workers = max(1, min(parallel, len(issue_keys)))
+    if workers == 1:
+        for issue_key in issue_keys:
+            yield transition_issue(server, token, issue_key, transition_name, resolution, verify, cache_transitions)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Build the shared client up front: lru_cache does not serialise concurrent
+    # misses, so workers starting together would each create their own
+    get_jira_client(server, token, workers)
+
+    def worker(issue_key: str) -> Dict[str, Any]:
+        return transition_issue(server, token, issue_key, transition_name, resolution, verify, cache_transitions,
+                                pool_size=workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(worker, issue_keys)
+
+
+async def _request_async(client, method: str, url: str, **kwargs):
+    """
+    Make a REST request with httpx, retrying transient failures with backoff.
+
+    Args:
+        client: httpx.AsyncClient
+        method: 'GET' or 'POST'
+        url: Request URL
+        **kwargs: Passed on to client.request()
+
+    Returns:
+        The final response
+    """
+    import asyncio
+    import httpx
+
+    for attempt in range(RETRY_ATTEMPTS):
+        last_attempt = attempt == RETRY_ATTEMPTS - 1
+        try:
+            resp = await client.request(method, url, **kwargs)
+            if resp.status_code not in _ASYNC_RETRY_STATUSES[method] or last_attempt:
+                return resp
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            # The request never reached the server, so retrying is safe for any method
+            if last_attempt:
+                raise
+        await asyncio.sleep(_retry_delay(attempt))
+
+
+async def transition_issue_async(client, server: str, issue_key: str, transition_name: Optional[str],
+                                 resolution: str = None,
+                                 verify: bool = False, cache_transitions: bool = False) -> Dict[str, Any]:
+    """
+    Transition a JIRA issue through a specified transition using httpx.
+
+    Talks to the REST API directly with the same requests as transition_issue().
+
+    Args:
+        client: httpx.AsyncClient carrying the authorization header
+        server: JIRA server URL
         issue_key: The issue key (e.g., "PROJ-123")
+        transition_name: The name of the transition to execute, or None to only
+            list the available transitions
+        resolution: Optional resolution to set during transition
+        verify: Re-fetch the issue afterwards to report its actual status
+        cache_transitions: Reuse the transition id resolved for the same project and name
+
+    Returns:
+        Outcome record, as for transition_issue()
     """
+    import httpx
+
+    result = _new_result(issue_key, transition_name, resolution)
+    issue_url = f"{server.rstrip('/')}/rest/api/2/issue/{issue_key}"
+    payload = {}
+    if resolution:
+        payload['fields'] = {'resolution': {'name': resolution}}
+
     try:
-        # Initialize JIRA connection
-        jira = JIRA(server=server, token_auth=token)
+        # Try a recently resolved transition id straight away
+        target_transition = None
+        if cache_transitions and transition_name is not None:
+            target_transition = _cached_transition(server, issue_key, transition_name)
+            if target_transition:
+                payload['transition'] = {'id': target_transition['id']}
+                resp = await _request_async(client, 'POST', f"{issue_url}/transitions", json=payload)
+                if resp.status_code == 400:
+                    # Not valid from this issue's status or workflow; resolve it afresh
+                    _remember_transition(server, issue_key, transition_name, None)
+                    target_transition = None
+                else:
+                    resp.raise_for_status()
 
-        # Get the issue
-        issue = jira.issue(issue_key)
-        print(f"Issue {issue_key} - Current status: {issue.fields.status.name}")
+        if not target_transition:
+            # Get the issue's status along with its available transitions in one request
+            resp = await _request_async(client, 'GET', issue_url, params={'fields': 'status', 'expand': 'transitions'})
+            resp.raise_for_status()
+            issue = resp.json()
+            result['from'] = issue['fields']['status']['name']
+            transitions = issue.get('transitions', [])
 
-        # Get available transitions
-        transitions = jira.transitions(issue)
+            if transition_name is None:
+                result['available'] = [transition['name'] for transition in transitions]
+                result['success'] = True
+                return result
 
-        if not transitions:
-            print("No transitions available for this issue.")
-            return
+            # Find the requested transition
+            target_transition = _find_transition(transitions, transition_name)
 
-        print("\nAvailable transitions:")
-        for transition in transitions:
-            print(f"  - {transition['name']}")
+            if not target_transition:
+                result['available'] = [transition['name'] for transition in transitions]
+                return result
 
-    except Exception as e:
-        print(f"Error getting transitions for issue {issue_key}: {e}")
-        sys.exit(1)
+            # Execute the transition
+            payload['transition'] = {'id': target_transition['id']}
+            resp = await _request_async(client, 'POST', f"{issue_url}/transitions", json=payload)
+            resp.raise_for_status()
+
+            if cache_transitions:
+                _remember_transition(server, issue_key, transition_name, target_transition)
+
+        if verify:
+            resp = await _request_async(client, 'GET', issue_url, params={'fields': 'status'})
+            resp.raise_for_status()
+            result['to'] = resp.json()['fields']['status']['name']
+        else:
+            result['to'] = target_transition.get('to', {}).get('name', transition_name)
+        result['success'] = True
+
+    except (httpx.HTTPError, ValueError) as e:
+        # ValueError covers replies that are not JSON, such as an SSO or proxy login page
+        result['error'] = str(e)
+    return result
+
+
+async def transition_many_async(server: str, token: str, issue_keys: List[str], transition_name: Optional[str],
+                                resolution: str = None, verify: bool = False, cache_transitions: bool = False,
+                                parallel: int = DEFAULT_PARALLEL) -> List[Dict[str, Any]]:
+    """
+    Transition several JIRA issues concurrently on one httpx client.
+
+    HTTP/2 is used when the h2 package is installed and the server offers it, so
+    every request is multiplexed over a single TLS connection; otherwise requests
+    share a pool of kept-alive HTTP/1.1 connections.
+
+    Args:
+        server: JIRA server URL
+        token: JIRA personal access token
+        issue_keys: The issue keys (e.g., ["PROJ-123", "PROJ-456"])
+        transition_name: The name of the transition to execute, or None to only
+            list the available transitions
+        resolution: Optional resolution to set during transition
+        verify: Re-fetch each issue afterwards to report its actual status
+        cache_transitions: Reuse transition ids resolved for the same project and name
+        parallel: Maximum number of issues handled at once
+
+    Returns:
+        Outcome record for each issue, in the order of issue_keys
+    """
+    import asyncio
+    import httpx
+
+    parallel = max(1, parallel)
+    limits = httpx.Limits(max_connections=parallel, max_keepalive_connections=parallel)
+    headers = {'Authorization': f'Bearer {token}', 'Accept': 'application/json'}
+    http2 = importlib.util.find_spec('h2') is not None
+
+    # HTTP/2 streams aren't bounded by the connection limit, so cap in-flight issues explicitly
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def worker(client, issue_key: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await transition_issue_async(client, server, issue_key, transition_name, resolution, verify,
+                                                cache_transitions)
+
+    async with httpx.AsyncClient(http2=http2, limits=limits, headers=headers, timeout=60) as client:
+        return await asyncio.gather(*(worker(client, issue_key) for issue_key in issue_keys))
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Transition a JIRA issue through a workflow transition')
-    parser.add_argument('issue_key', help='JIRA issue key (e.g., PROJ-123)')
-    parser.add_argument('transition_name', nargs='?', help='Name of the transition to execute')
+    parser = argparse.ArgumentParser(description='Transition JIRA issues through a workflow transition',
+                                     usage='%(prog)s [options] issue_key [issue_key ...] [transition_name]')
+    parser.add_argument('issue_key', nargs='+',
+                       help='JIRA issue keys (e.g., PROJ-123), followed by the name of the transition to execute '
+                            'unless --list-transitions is given')
     parser.add_argument('--url', help='JIRA instance URL',
                        default=os.environ.get('JIRA_URL'))
     parser.add_argument('--token', help='JIRA personal access token',
                        default=os.environ.get('JIRA_TOKEN'))
     parser.add_argument('--list-transitions', action='store_true',
-                       help='List available transitions for the issue and exit')
+                       help='List available transitions for the issues and exit')
     parser.add_argument('--resolution', help='Resolution to set during transition (e.g., "Fixed", "Won\'t Fix", "Duplicate")')
+    parser.add_argument('--verify', action='store_true',
+                       help='Re-fetch the issue after transitioning to report its actual status')
+    parser.add_argument('--cache-transitions', action='store_true',
+                       help='Reuse transition ids resolved for the same project in the last 10 minutes '
+                            '(only safe when the project uses a single workflow)')
+    parser.add_argument('--parallel', type=int, default=DEFAULT_PARALLEL,
+                       help=f'Number of issues to transition concurrently (default: {DEFAULT_PARALLEL})')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='Transition issues with httpx instead of threads, over HTTP/2 where available, '
+                            'for large batches (requires httpx)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Output format for transition results (default: text)')
 
     args = parser.parse_args()
 
@@ -125,18 +576,40 @@ def main():
         print("Environment variables: JIRA_URL, JIRA_TOKEN")
         sys.exit(1)
 
-    # Handle --list-transitions option
+    # With --list-transitions every positional is an issue key and nothing is transitioned
     if args.list_transitions:
-        list_transitions(args.url, args.token, args.issue_key)
-        return
+        issue_keys, transition_name = args.issue_key, None
+    else:
+        # Validate transition name is provided; it follows the issue keys
+        if len(args.issue_key) < 2:
+            print("Error: transition_name is required unless using --list-transitions")
+            parser.print_help()
+            sys.exit(1)
+        issue_keys, transition_name = args.issue_key[:-1], args.issue_key[-1]
 
-    # Validate transition name is provided
-    if not args.transition_name:
-        print("Error: transition_name is required unless using --list-transitions")
-        parser.print_help()
-        sys.exit(1)
+    if args.use_async:
+        # Optional, and slow to import, so only loaded when asked for
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            print("httpx not installed. Run: pip install 'httpx[http2]'")
+            sys.exit(1)
+        import asyncio
+        results = asyncio.run(transition_many_async(args.url, args.token, issue_keys, transition_name,
+                                                    args.resolution, args.verify, args.cache_transitions,
+                                                    args.parallel))
+    else:
+        results = transition_many(args.url, args.token, issue_keys, transition_name, args.resolution, args.verify,
+                                  args.cache_transitions, args.parallel)
 
-    transition_issue(args.url, args.token, args.issue_key, args.transition_name, args.resolution)
+    # Report from the main thread only, each issue as soon as its turn comes, so
+    # an interrupted batch still shows every transition already made
+    all_succeeded = True
+    for result in results:
+        print_result(result, args.format)
+        all_succeeded = all_succeeded and result['success']
+    if not all_succeeded:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
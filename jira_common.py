@@ -0,0 +1,68 @@
+"""
+JIRA Common
+
+Shared JIRA client setup and cache location for the stale issue management scripts.
+"""
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jira import JIRA
+
+# Connections kept open per host; callers issuing concurrent requests should match their worker count
+DEFAULT_POOL_SIZE = 10
+
+
+def make_jira(server: str, token: str, pool_size: int = DEFAULT_POOL_SIZE) -> 'JIRA':
+    """
+    Create a JIRA client whose session pools connections and retries transient failures.
+
+    The returned client's session keeps TLS connections alive, so a caller that
+    reuses the client for many issues pays the handshake once. Idempotent requests
+    are retried with backoff on 5xx gateway errors; jira-python's own session
+    already retries rate limiting (429) and connection errors.
+
+    Server version info is not needed by these scripts, so the /serverInfo
+    request made by default on construction is skipped.
+
+    jira and requests take a noticeable fraction of a second to import, so they
+    are only imported here, once a client is actually needed.
+
+    Args:
+        server: JIRA server URL
+        token: JIRA personal access token
+        pool_size: Number of connections to keep open per host
+
+    Returns:
+        Configured JIRA client
+    """
+    try:
+        from jira import JIRA
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        print("Required dependencies not installed. Run: pip install jira requests")
+        sys.exit(1)
+
+    jira = JIRA(server=server, token_auth=token, get_server_info=False)
+
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    jira._session.mount('https://', adapter)
+    jira._session.mount('http://', adapter)
+
+    return jira
+
+
+def cache_dir() -> str:
+    """
+    Return the directory used for on-disk caches, creating it if needed.
+
+    Honours $XDG_CACHE_HOME and defaults to ~/.cache/jira-stalebot.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    path = os.path.join(base, 'jira-stalebot')
+    os.makedirs(path, exist_ok=True)
+    return path